@@ -3,14 +3,17 @@ Auto Maze Solver - Fixed Window Layout
 """
 
 import pygame
+import numpy as np
 import random
-import math
-import heapq
 from collections import deque
+from itertools import permutations
+
+import solvers_numba
 
 # ---------- Config ----------
 WIDTH, HEIGHT = 1400, 900
 FPS = 60
+MAX_STEPS_PER_FRAME = 64
 
 DIFFICULTIES = {
     "Easy": (25, 17, 8),
@@ -35,205 +38,368 @@ TEXT = (30, 41, 59)
 TEXT_LIGHT = (100, 116, 139)
 BORDER = (203, 213, 225)
 
-# ---------- Maze Classes ----------
-class Cell:
-    def __init__(self, c, r):
-        self.c = c
-        self.r = r
-        self.walls = [True, True, True, True]
-        self.visited = False
+# Wall bitflags; directions are numbered 0-3 in N/E/S/W order throughout
+N_BIT, E_BIT, S_BIT, W_BIT = 1, 2, 4, 8
+ALL_WALLS = N_BIT | E_BIT | S_BIT | W_BIT
+DIR_BITS = (N_BIT, E_BIT, S_BIT, W_BIT)
+OPPOSITE_BITS = (S_BIT, W_BIT, N_BIT, E_BIT)
+# All 24 orders of the four directions, for shuffling neighbours by index
+DIR_PERMUTATIONS = tuple(permutations(range(4)))
 
+# ---------- Maze Classes ----------
 class Maze:
-    def __init__(self, cols, rows):
+    def __init__(self, cols, rows, seed=None):
         self.cols = cols
         self.rows = rows
-        self.grid = [Cell(c, r) for r in range(rows) for c in range(cols)]
-        self.stack = []
+        self.walls = np.full(rows * cols, ALL_WALLS, dtype=np.uint8)
+        self.visited = np.zeros(rows * cols, dtype=np.bool_)
+        self.stack = np.empty(rows * cols, dtype=np.int32)
+        self.rng = random.Random(seed)
+        self.build_adjacency()
 
     def index(self, c, r):
         if c < 0 or r < 0 or c >= self.cols or r >= self.rows:
             return None
         return r * self.cols + c
 
-    def get(self, c, r):
-        idx = self.index(c, r)
-        return self.grid[idx] if idx is not None else None
-
-    def neighbors_with_walls(self, cell):
-        res = []
-        dirs = [(0, -1), (1, 0), (0, 1), (-1, 0)]
-        for i, (dc, dr) in enumerate(dirs):
-            n = self.get(cell.c + dc, cell.r + dr)
-            if n and not n.visited:
-                res.append((n, i))
-        return res
-
-    def remove_walls(self, a: Cell, b: Cell):
-        dx = b.c - a.c
-        dy = b.r - a.r
-        if dx == 1:
-            a.walls[1] = False
-            b.walls[3] = False
-        elif dx == -1:
-            a.walls[3] = False
-            b.walls[1] = False
-        elif dy == 1:
-            a.walls[2] = False
-            b.walls[0] = False
-        elif dy == -1:
-            a.walls[0] = False
-            b.walls[2] = False
+    def coords(self, idx):
+        r, c = divmod(idx, self.cols)
+        return c, r
+
+    def wall_runs(self, bit):
+        # Runs of cells whose `bit` wall stands, as (line, first, last): lines
+        # are rows for N/S walls and columns for E/W walls
+        grid = (self.walls.reshape(self.rows, self.cols) & bit) != 0
+        if bit in (E_BIT, W_BIT):
+            grid = grid.T
+        padded = np.zeros((grid.shape[0], grid.shape[1] + 2), dtype=np.int8)
+        padded[:, 1:-1] = grid
+        edges = np.diff(padded, axis=1)
+        lines, starts = np.nonzero(edges == 1)
+        _, ends = np.nonzero(edges == -1)
+        return zip(lines.tolist(), starts.tolist(), (ends - 1).tolist())
 
     def generate_recursive_backtracker(self, animate_callback=None):
-        for cell in self.grid:
-            cell.visited = False
-            cell.walls = [True, True, True, True]
-        start = self.get(0, 0)
-        start.visited = True
-        self.stack = [start]
-        while self.stack:
-            current = self.stack[-1]
-            neighbors = self.neighbors_with_walls(current)
-            if neighbors:
-                nxt, _dir = random.choice(neighbors)
-                nxt.visited = True
-                self.remove_walls(current, nxt)
-                self.stack.append(nxt)
+        cols, rows = self.cols, self.rows
+        walls, visited, stack = self.walls, self.visited, self.stack
+        walls.fill(ALL_WALLS)
+        visited.fill(False)
+        offsets = (-cols, 1, cols, -1)
+        randrange = self.rng.randrange
+        candidates = [0, 0, 0, 0]
+        start = self.index(0, 0)
+        visited[start] = True
+        stack[0] = start
+        top = 1
+        while top:
+            current = int(stack[top - 1])
+            r, c = divmod(current, cols)
+            k = 0
+            if r > 0 and not visited[current - cols]:
+                candidates[k] = 0
+                k += 1
+            if c < cols - 1 and not visited[current + 1]:
+                candidates[k] = 1
+                k += 1
+            if r < rows - 1 and not visited[current + cols]:
+                candidates[k] = 2
+                k += 1
+            if c > 0 and not visited[current - 1]:
+                candidates[k] = 3
+                k += 1
+            if k:
+                d = candidates[randrange(k)]
+                nxt = current + offsets[d]
+                visited[nxt] = True
+                walls[current] &= ALL_WALLS ^ DIR_BITS[d]
+                walls[nxt] &= ALL_WALLS ^ OPPOSITE_BITS[d]
+                stack[top] = nxt
+                top += 1
             else:
-                self.stack.pop()
+                top -= 1
             if animate_callback:
                 animate_callback()
-        for cell in self.grid:
-            cell.visited = False
+        visited.fill(False)
+        self.build_adjacency()
+
+    def build_adjacency(self):
+        # adj[i, d] is the neighbour through side d, or -1 if that wall stands.
+        # Border walls are never carved, so an open side always has a neighbour.
+        n = self.rows * self.cols
+        idx = np.arange(n, dtype=np.int32)
+        offsets = (-self.cols, 1, self.cols, -1)
+        self.adj = np.full((n, 4), -1, dtype=np.int32)
+        for d in range(4):
+            open_side = (self.walls & DIR_BITS[d]) == 0
+            self.adj[open_side, d] = idx[open_side] + offsets[d]
+        # Plain-int rows for the Python solvers; indexing numpy scalars is slow
+        self.neighbors = [tuple(x for x in row if x >= 0) for row in self.adj.tolist()]
 
 # ---------- Pathfinding ----------
-def reconstruct_path(came_from, end_idx):
+class SearchState:
+    """Live structures a solver mutates in place; the visualizer only reads them."""
+    def __init__(self, n_cells):
+        self.visited = np.zeros(n_cells, dtype=np.bool_)
+        self.parent = np.full(n_cells, -1, dtype=np.int32)
+
+class BucketHeap:
+    """Dial's bucket queue for small integer keys.
+
+    Keys may never drop below the last popped key or run more than `span - 1`
+    past it, which holds for unit-cost mazes. Stale duplicates are left in
+    place; callers skip nodes they have already closed.
+    """
+    def __init__(self, span):
+        self.buckets = [deque() for _ in range(span)]
+        self.span = span
+        self.current = 0
+        self.size = 0
+
+    def __len__(self):
+        return self.size
+
+    def push(self, node, key):
+        self.buckets[key % self.span].append(node)
+        self.size += 1
+
+    def pop(self):
+        bucket = self.buckets[self.current % self.span]
+        while not bucket:
+            self.current += 1
+            bucket = self.buckets[self.current % self.span]
+        self.size -= 1
+        return bucket.popleft()
+
+def reconstruct_path(parent, end_idx):
+    # Start-exclusive, like the old came_from walk: the start has no parent
+    parent = parent.tolist()
     path = []
     current = end_idx
-    while current in came_from:
+    while parent[current] >= 0:
         path.append(current)
-        current = came_from[current]
+        current = parent[current]
     path.reverse()
     return path
 
 def cell_neighbors_walkable(maze: Maze, cell_idx):
-    cell = maze.grid[cell_idx]
-    c, r = cell.c, cell.r
-    dirs = [(0, -1), (1, 0), (0, 1), (-1, 0)]
-    for i, (dc, dr) in enumerate(dirs):
-        if not cell.walls[i]:
-            n = maze.get(c + dc, r + dr)
-            if n:
-                yield maze.index(n.c, n.r)
-
-def DFS_generator(maze: Maze, start_idx, end_idx):
-    visited = set()
-    stack = [(start_idx, None)]
-    came_from = {}
-    while stack:
-        node, parent = stack.pop()
-        if node in visited:
+    return maze.neighbors[cell_idx]
+
+def DFS_generator(maze: Maze, start_idx, end_idx, state=None):
+    n_cells = maze.rows * maze.cols
+    if state is None:
+        state = SearchState(n_cells)
+    visited = state.visited
+    parent = state.parent
+    adj = maze.adj.tolist()
+    randrange = random.randrange
+    # Each expansion pushes at most 4 entries. Only unvisited nodes are pushed
+    # and the latest push is popped first, so parent[] is final once visited
+    stack = [0] * (4 * n_cells + 1)
+    stack[0] = start_idx
+    top = 1
+    while top:
+        top -= 1
+        node = stack[top]
+        if visited[node]:
             continue
-        visited.add(node)
-        if parent is not None:
-            came_from[node] = parent
-        yield ("visit", node, visited, came_from)
+        visited[node] = True
+        yield ("visit", node)
         if node == end_idx:
-            yield ("found", reconstruct_path(came_from, end_idx))
+            yield ("found", reconstruct_path(parent, end_idx))
             return
-        neighbors = list(cell_neighbors_walkable(maze, node))
-        random.shuffle(neighbors)
-        for n in neighbors:
-            if n not in visited:
-                stack.append((n, node))
+        row = adj[node]
+        for d in DIR_PERMUTATIONS[randrange(24)]:
+            n = row[d]
+            if n >= 0 and not visited[n]:
+                stack[top] = n
+                parent[n] = node
+                top += 1
     yield ("notfound",)
 
-def BFS_generator(maze: Maze, start_idx, end_idx):
-    visited = set([start_idx])
-    q = deque([(start_idx, None)])
-    came_from = {}
+def BFS_generator(maze: Maze, start_idx, end_idx, state=None):
+    if state is None:
+        state = SearchState(maze.rows * maze.cols)
+    visited = state.visited
+    visited[start_idx] = True
+    parent = state.parent
+    q = deque([start_idx])
     while q:
-        node, parent = q.popleft()
-        if parent is not None:
-            came_from[node] = parent
-        yield ("visit", node, visited, came_from)
+        node = q.popleft()
+        yield ("visit", node)
         if node == end_idx:
-            yield ("found", reconstruct_path(came_from, end_idx))
+            yield ("found", reconstruct_path(parent, end_idx))
             return
         for n in cell_neighbors_walkable(maze, node):
-            if n not in visited:
-                visited.add(n)
-                q.append((n, node))
+            if not visited[n]:
+                visited[n] = True
+                parent[n] = node
+                q.append(n)
     yield ("notfound",)
 
-def dijkstra_generator(maze: Maze, start_idx, end_idx):
-    dist = {start_idx: 0}
-    came_from = {}
-    visited = set()
-    heap = [(0, start_idx, None)]
+def bi_bfs_generator(maze: Maze, start_idx, end_idx, state=None):
+    n_cells = maze.rows * maze.cols
+    if state is None:
+        state = SearchState(n_cells)
+    visited = state.visited
+    # side[i] is 1 if reached from the start, 2 if reached from the end
+    side = np.zeros(n_cells, dtype=np.int8)
+    parents = (None, state.parent, np.full(n_cells, -1, dtype=np.int32))
+    frontiers = (None, deque([start_idx]), deque([end_idx]))
+    side[start_idx] = 1
+    side[end_idx] = 2
+    visited[start_idx] = visited[end_idx] = True
+    if start_idx == end_idx:
+        yield ("visit", start_idx)
+        yield ("found", [])
+        return
+    turn = 1
+    while frontiers[1] and frontiers[2]:
+        # Expand one whole level of the current side, then swap sides. The
+        # maze is a perfect maze, so the first edge joining the sides lies on
+        # the one and only path.
+        q, parent = frontiers[turn], parents[turn]
+        for _ in range(len(q)):
+            node = q.popleft()
+            yield ("visit", node)
+            for n in cell_neighbors_walkable(maze, node):
+                if not side[n]:
+                    side[n] = turn
+                    visited[n] = True
+                    parent[n] = node
+                    q.append(n)
+                elif side[n] != turn:
+                    fwd, bwd = (node, n) if turn == 1 else (n, node)
+                    back_half = reconstruct_path(parents[2], bwd)
+                    back_half.reverse()
+                    yield ("found", reconstruct_path(parents[1], fwd) + back_half + [end_idx])
+                    return
+        turn = 3 - turn
+    yield ("notfound",)
+
+def dijkstra_generator(maze: Maze, start_idx, end_idx, state=None):
+    n_cells = maze.rows * maze.cols
+    if state is None:
+        state = SearchState(n_cells)
+    dist = np.full(n_cells, np.iinfo(np.int32).max, dtype=np.int32)
+    dist[start_idx] = 0
+    parent = state.parent
+    visited = state.visited
+    heap = BucketHeap(maze.rows + maze.cols + 2)
+    heap.push(start_idx, 0)
     while heap:
-        d, node, parent = heapq.heappop(heap)
-        if node in visited:
+        node = heap.pop()
+        if visited[node]:
             continue
-        visited.add(node)
-        if parent is not None:
-            came_from[node] = parent
-        yield ("visit", node, visited, came_from)
+        visited[node] = True
+        yield ("visit", node)
         if node == end_idx:
-            yield ("found", reconstruct_path(came_from, end_idx))
+            yield ("found", reconstruct_path(parent, end_idx))
             return
+        nd = int(dist[node]) + 1
         for n in cell_neighbors_walkable(maze, node):
-            nd = d + 1
-            if n not in dist or nd < dist[n]:
+            if nd < dist[n]:
                 dist[n] = nd
-                heapq.heappush(heap, (nd, n, node))
+                parent[n] = node
+                heap.push(n, nd)
     yield ("notfound",)
 
-def manhattan(a_idx, b_idx, maze: Maze):
-    a = maze.grid[a_idx]
-    b = maze.grid[b_idx]
-    return abs(a.c - b.c) + abs(a.r - b.r)
-
-def a_star_generator(maze: Maze, start_idx, end_idx):
-    gscore = {start_idx: 0}
-    fscore = {start_idx: manhattan(start_idx, end_idx, maze)}
-    came_from = {}
-    open_heap = [(fscore[start_idx], start_idx, None)]
-    open_set = {start_idx}
-    closed_set = set()
+def manhattan_table(maze: Maze, end_idx):
+    # Distance from every cell to end_idx, computed in one vectorised pass
+    er, ec = divmod(end_idx, maze.cols)
+    idx = np.arange(maze.rows * maze.cols)
+    return (np.abs(idx % maze.cols - ec) + np.abs(idx // maze.cols - er)).tolist()
+
+def a_star_generator(maze: Maze, start_idx, end_idx, state=None):
+    n_cells = maze.rows * maze.cols
+    if state is None:
+        state = SearchState(n_cells)
+    h = manhattan_table(maze, end_idx)
+    gscore = np.full(n_cells, np.iinfo(np.int32).max, dtype=np.int32)
+    gscore[start_idx] = 0
+    parent = state.parent
+    closed_set = state.visited
+    open_heap = BucketHeap(maze.rows + maze.cols + 2)
+    open_heap.push(start_idx, h[start_idx])
     while open_heap:
-        f, node, parent = heapq.heappop(open_heap)
-        if node in closed_set:
+        node = open_heap.pop()
+        if closed_set[node]:
             continue
-        open_set.discard(node)
-        closed_set.add(node)
-        if parent is not None:
-            came_from[node] = parent
-        yield ("visit", node, closed_set, came_from)
+        closed_set[node] = True
+        yield ("visit", node)
         if node == end_idx:
-            yield ("found", reconstruct_path(came_from, end_idx))
+            yield ("found", reconstruct_path(parent, end_idx))
             return
+        tentative_g = int(gscore[node]) + 1
         for n in cell_neighbors_walkable(maze, node):
-            tentative_g = gscore[node] + 1
-            if n in closed_set and tentative_g >= gscore.get(n, math.inf):
+            if closed_set[n] and tentative_g >= gscore[n]:
                 continue
-            if tentative_g < gscore.get(n, math.inf):
-                came_from[n] = node
+            if tentative_g < gscore[n]:
+                parent[n] = node
                 gscore[n] = tentative_g
-                fscore[n] = tentative_g + manhattan(n, end_idx, maze)
-                heapq.heappush(open_heap, (fscore[n], n, node))
-                open_set.add(n)
+                open_heap.push(n, tentative_g + h[n])
     yield ("notfound",)
 
-ALGORITHM_MAP = {
+def replay_search(result, end_idx, state=None):
+    # Feeds a compiled kernel's result to the visualizer one step at a time
+    expanded, marked, mark_counts, parent, path = result
+    if state is None:
+        state = SearchState(len(parent))
+    visited = state.visited
+    parents = parent.tolist()
+    marked = marked.tolist()
+    prev = 0
+    for node, count in zip(expanded.tolist(), mark_counts.tolist()):
+        # Usually zero to three cells per step, so scalar writes beat a slice
+        for m in marked[prev:count]:
+            visited[m] = True
+        prev = count
+        state.parent[node] = parents[node]
+        yield ("visit", node)
+    # Bidirectional search finishes away from end_idx, so go by the path
+    if len(path) or (len(expanded) and expanded[-1] == end_idx):
+        yield ("found", path.tolist())
+    else:
+        yield ("notfound",)
+
+def DFS_compiled(maze: Maze, start_idx, end_idx, state=None):
+    return replay_search(solvers_numba.dfs(maze.adj, start_idx, end_idx), end_idx, state)
+
+def BFS_compiled(maze: Maze, start_idx, end_idx, state=None):
+    return replay_search(solvers_numba.bfs(maze.adj, start_idx, end_idx), end_idx, state)
+
+def bi_bfs_compiled(maze: Maze, start_idx, end_idx, state=None):
+    return replay_search(solvers_numba.bibfs(maze.adj, start_idx, end_idx), end_idx, state)
+
+def dijkstra_compiled(maze: Maze, start_idx, end_idx, state=None):
+    return replay_search(solvers_numba.dijkstra(maze.adj, start_idx, end_idx), end_idx, state)
+
+def a_star_compiled(maze: Maze, start_idx, end_idx, state=None):
+    return replay_search(solvers_numba.astar(maze.adj, start_idx, end_idx, maze.cols), end_idx, state)
+
+PYTHON_ALGORITHM_MAP = {
     "DFS": DFS_generator,
     "BFS": BFS_generator,
     "Dijkstra": dijkstra_generator,
     "A*": a_star_generator,
+    "BFS-Bi": bi_bfs_generator,
 }
 
+COMPILED_ALGORITHM_MAP = {
+    "DFS": DFS_compiled,
+    "BFS": BFS_compiled,
+    "Dijkstra": dijkstra_compiled,
+    "A*": a_star_compiled,
+    "BFS-Bi": bi_bfs_compiled,
+}
+
+# The pure-Python generators stay as the fallback when numba is not installed
+ALGORITHM_MAP = COMPILED_ALGORITHM_MAP if solvers_numba.NUMBA_AVAILABLE else PYTHON_ALGORITHM_MAP
+
 # ---------- Button Class ----------
 class Button:
+    __slots__ = ('rect', 'text', 'action', 'font', 'hovered', 'active',
+                 '_surf_inactive', '_surf_active', '_text_rect')
+
     def __init__(self, x, y, w, h, text, action, font):
         self.rect = pygame.Rect(x, y, w, h)
         self.text = text
@@ -241,6 +407,10 @@ class Button:
         self.font = font
         self.hovered = False
         self.active = False
+        # Text only changes colour with `active`, so render both once
+        self._surf_inactive = font.render(text, True, TEXT)
+        self._surf_active = font.render(text, True, (255, 255, 255))
+        self._text_rect = self._surf_inactive.get_rect(center=self.rect.center)
         
     def draw(self, screen):
         if self.active:
@@ -252,10 +422,8 @@ class Button:
             
         pygame.draw.rect(screen, color, self.rect, border_radius=6)
         
-        text_color = (255, 255, 255) if self.active else TEXT
-        text_surf = self.font.render(self.text, True, text_color)
-        text_rect = text_surf.get_rect(center=self.rect.center)
-        screen.blit(text_surf, text_rect)
+        text_surf = self._surf_active if self.active else self._surf_inactive
+        screen.blit(text_surf, self._text_rect)
     
     def handle_event(self, event, mouse_pos):
         self.hovered = self.rect.collidepoint(mouse_pos)
@@ -283,21 +451,56 @@ class Visualizer:
             self.font_title = pygame.font.Font(None, 34)
             self.font_label = pygame.font.Font(None, 14)
         
+        # Panel headings never change, so render them once
+        self.title_surf = self.font_title.render("Auto Maze", True, TEXT)
+        self.subtitle_surf = self.font.render("Solver", True, TEXT_LIGHT)
+        self.algorithm_label_surf = self.font_label.render("ALGORITHM", True, TEXT_LIGHT)
+        self.stats_label_surf = self.font_label.render("STATISTICS", True, TEXT_LIGHT)
+        self.status_surfs = {}
+        
         self.algorithm_name = "A*"
         self.running_search = False
         self.search_generator = None
-        self.search_visited = set()
-        self.search_came_from = {}
+        self.search_visited = np.zeros(0, dtype=np.bool_)
         self.search_path = []
         self.generating = False
         self.search_complete = False
+        self.path_dots = {}
+        self.dirty = []
+        self.stats_key = None
+        self.stats_surfs = []
+        self.compiling = False
         
         self.set_difficulty(difficulty_name)
+        self.warm_up_solvers()
+
+    def warm_up_solvers(self):
+        # numba compiles each kernel on first use; do it up front, with a
+        # status shown, instead of freezing the first search of each kind
+        if not solvers_numba.NUMBA_AVAILABLE:
+            return
+        self.compiling = True
+        
+        def cb():
+            self.draw()
+            pygame.display.flip()
+            for e in pygame.event.get():
+                if e.type == pygame.QUIT:
+                    pygame.quit()
+                    raise SystemExit
+        
+        cb()
+        solvers_numba.warm_up(callback=cb)
+        self.compiling = False
+        self.mark_all_dirty()
 
     def set_difficulty(self, name):
         self.diff_name = name
         self.cols, self.rows, self.step_delay = DIFFICULTIES[name]
-        
+        self._recompute_layout()
+        self._reset_maze()
+
+    def _recompute_layout(self):
         # Fixed layout calculations using current window size
         self.margin = 20
         self.panel_w = 280
@@ -325,10 +528,21 @@ class Visualizer:
         self.panel_y = self.margin
         self.panel_h = self.height - (2 * self.margin)
         
+        self.setup_buttons()
+        
+        # Stats box and status line at the bottom of the panel, pushed down
+        # below the last row of buttons when the window is too short
+        stats_top = max(self.panel_y + self.panel_h - 180, self.buttons[-1].rect.bottom + 15)
+        self.stats_rect = pygame.Rect(self.panel_x, stats_top, self.panel_w, 180)
+        self.maze_rect = pygame.Rect(self.maze_x, self.maze_y, self.maze_w, self.maze_h)
+        
+        # Cached surfaces depend on cell size; draw() rebuilds them on demand
+        self.maze_surface = None
+
+    def _reset_maze(self):
         self.maze = Maze(self.cols, self.rows)
         self.generate_maze(animated=False)
         self.reset_search_state()
-        self.setup_buttons()
         
         self.start_idx = self.maze.index(0, 0)
         self.end_idx = self.maze.index(self.cols - 1, self.rows - 1)
@@ -342,7 +556,7 @@ class Visualizer:
         py = self.panel_y + 110
         
         # Algorithm buttons
-        for alg in ["DFS", "BFS", "Dijkstra", "A*"]:
+        for alg in ALGORITHM_MAP:
             btn = Button(px, py, bw, bh, alg, 
                         lambda a=alg: self.select_algorithm(a), self.font)
             self.buttons.append(btn)
@@ -378,6 +592,8 @@ class Visualizer:
         self.search_complete = False
         
         def cb():
+            self.render_maze_surface()
+            self.search_surface = self.maze_surface
             self.draw()
             pygame.display.flip()
             pygame.time.delay(max(1, int(self.step_delay)))
@@ -392,6 +608,7 @@ class Visualizer:
             self.maze.generate_recursive_backtracker(animate_callback=None)
         
         self.generating = False
+        self.render_maze_surface()
         self.start_idx = self.maze.index(0, 0)
         self.end_idx = self.maze.index(self.maze.cols - 1, self.maze.rows - 1)
         self.reset_search_state()
@@ -399,10 +616,37 @@ class Visualizer:
     def reset_search_state(self):
         self.running_search = False
         self.search_generator = None
-        self.search_visited = set()
-        self.search_came_from = {}
+        self.search_state = SearchState(self.rows * self.cols)
+        self.search_visited = self.search_state.visited
         self.search_path = []
         self.search_complete = False
+        self.rebuild_search_surface()
+        self.mark_all_dirty()
+
+    def rebuild_search_surface(self):
+        # Visited cells are tinted into an opaque copy of the maze as they
+        # arrive, so each frame is a solid blit instead of an alpha blend
+        if self.maze_surface is None:
+            self.render_maze_surface()
+        self.search_surface = self.maze_surface.copy()
+        self.visited_tile = pygame.Surface((self.cell_size, self.cell_size), pygame.SRCALPHA)
+        self.visited_tile.fill((*VISITED, 100))
+        self.painted_visited = np.zeros(self.rows * self.cols, dtype=np.bool_)
+        self.paint_visited()
+
+    def mark_all_dirty(self):
+        self.dirty = [self.screen.get_rect()]
+
+    def paint_visited(self):
+        # Only cells that joined the visited set since the last step are tinted
+        new_cells = np.flatnonzero(self.search_visited & ~self.painted_visited)
+        s = self.cell_size
+        pad = self.maze_pad
+        for idx in new_cells.tolist():
+            c, r = self.maze.coords(idx)
+            self.search_surface.blit(self.visited_tile, (pad + c * s, pad + r * s))
+            self.dirty.append(pygame.Rect(self.maze_x + c * s, self.maze_y + r * s, s, s))
+        self.painted_visited[new_cells] = True
 
     def run_search(self):
         if self.generating:
@@ -412,62 +656,97 @@ class Visualizer:
             return
         self.reset_search_state()
         self.running_search = True
-        self.search_generator = gen_func(self.maze, self.start_idx, self.end_idx)
-
-    def draw_cell(self, cell: Cell):
-        x = self.maze_x + cell.c * self.cell_size
-        y = self.maze_y + cell.r * self.cell_size
+        self.search_generator = gen_func(self.maze, self.start_idx, self.end_idx, self.search_state)
+
+    def render_maze_surface(self):
+        # Padded so the outer walls' line thickness is not clipped
+        self.maze_pad = max(1, self.cell_size // 8)
+        pad = self.maze_pad
+        self.maze_surface = pygame.Surface((self.maze_w + 2 * pad, self.maze_h + 2 * pad)).convert()
+        if self.cell_size <= 10:
+            self.blit_wall_pixels()
+        else:
+            self.maze_surface.fill(BG)
+            self.maze_surface.fill(CELL, (pad, pad, self.maze_w, self.maze_h))
+            self.draw_wall_lines()
+
+    def draw_wall_lines(self):
+        # One line per contiguous run of walls instead of one per cell side
+        surf = self.maze_surface
+        pad = self.maze_pad
         s = self.cell_size
-        
-        pygame.draw.rect(self.screen, CELL, (x, y, s, s))
-        
         wall_thickness = max(1, self.cell_size // 8)
-        if cell.walls[0]:
-            pygame.draw.line(self.screen, WALL, (x, y), (x + s - 1, y), wall_thickness)
-        if cell.walls[1]:
-            pygame.draw.line(self.screen, WALL, (x + s - 1, y), (x + s - 1, y + s - 1), wall_thickness)
-        if cell.walls[2]:
-            pygame.draw.line(self.screen, WALL, (x + s - 1, y + s - 1), (x, y + s - 1), wall_thickness)
-        if cell.walls[3]:
-            pygame.draw.line(self.screen, WALL, (x, y + s - 1), (x, y), wall_thickness)
+        surf.lock()
+        for bit, offset in ((N_BIT, 0), (S_BIT, s - 1)):
+            for r, c0, c1 in self.maze.wall_runs(bit):
+                y = pad + r * s + offset
+                pygame.draw.line(surf, WALL, (pad + c0 * s, y), (pad + c1 * s + s - 1, y), wall_thickness)
+        for bit, offset in ((W_BIT, 0), (E_BIT, s - 1)):
+            for c, r0, r1 in self.maze.wall_runs(bit):
+                x = pad + c * s + offset
+                pygame.draw.line(surf, WALL, (x, pad + r0 * s), (x, pad + r1 * s + s - 1), wall_thickness)
+        surf.unlock()
+
+    def blit_wall_pixels(self):
+        # Small cells always get 1px walls, so every wall is one row or column
+        # of pixels and the whole image can be written with numpy indexing
+        pad = self.maze_pad
+        s = self.cell_size
+        arr = np.empty((self.maze_w + 2 * pad, self.maze_h + 2 * pad, 3), dtype=np.uint8)
+        arr[:] = BG
+        arr[pad:pad + self.maze_w, pad:pad + self.maze_h] = CELL
+        walls = self.maze.walls.reshape(self.rows, self.cols)
+        span = np.arange(s)
+        for bit, offset in ((N_BIT, 0), (S_BIT, s - 1)):
+            r, c = np.nonzero(walls & bit)
+            xs = (pad + c * s)[:, None] + span
+            ys = (pad + r * s + offset)[:, None]
+            arr[xs, ys] = WALL
+        for bit, offset in ((W_BIT, 0), (E_BIT, s - 1)):
+            r, c = np.nonzero(walls & bit)
+            xs = (pad + c * s + offset)[:, None]
+            ys = (pad + r * s)[:, None] + span
+            arr[xs, ys] = WALL
+        pygame.surfarray.blit_array(self.maze_surface, arr)
+
+    def path_dot_surface(self, radius):
+        dot = self.path_dots.get(radius)
+        if dot is None:
+            dot = pygame.Surface((2 * radius, 2 * radius), pygame.SRCALPHA)
+            pygame.draw.circle(dot, PATH, (radius, radius), radius)
+            self.path_dots[radius] = dot
+        return dot
 
     def draw(self):
+        if self.maze_surface is None:
+            self.rebuild_search_surface()
         self.screen.fill(BG)
         
-        # Draw cells
-        for cell in self.maze.grid:
-            self.draw_cell(cell)
-        
-        # Visited cells
-        for idx in self.search_visited:
-            c = self.maze.grid[idx]
-            x = self.maze_x + c.c * self.cell_size
-            y = self.maze_y + c.r * self.cell_size
-            surf = pygame.Surface((self.cell_size, self.cell_size), pygame.SRCALPHA)
-            surf.fill((*VISITED, 100))
-            self.screen.blit(surf, (x, y))
+        # Static maze with visited cells already tinted in
+        self.screen.blit(self.search_surface, (self.maze_x - self.maze_pad, self.maze_y - self.maze_pad))
         
         # Path
         if self.search_path and len(self.search_path) >= 2:
             pts = []
             for idx in self.search_path:
-                c = self.maze.grid[idx]
-                x = self.maze_x + c.c * self.cell_size + self.cell_size // 2
-                y = self.maze_y + c.r * self.cell_size + self.cell_size // 2
+                c, r = self.maze.coords(idx)
+                x = self.maze_x + c * self.cell_size + self.cell_size // 2
+                y = self.maze_y + r * self.cell_size + self.cell_size // 2
                 pts.append((x, y))
             line_width = max(2, self.cell_size // 6)
             pygame.draw.lines(self.screen, PATH, False, pts, line_width)
             
             # Draw circles on path
             circle_radius = max(2, self.cell_size // 5)
-            for x, y in pts:
-                pygame.draw.circle(self.screen, PATH, (x, y), circle_radius)
+            dot = self.path_dot_surface(circle_radius)
+            self.screen.blits([(dot, (x - circle_radius, y - circle_radius)) for x, y in pts],
+                              doreturn=False)
         
         # Start & End
         for idx, color in [(self.start_idx, START), (self.end_idx, END)]:
-            c = self.maze.grid[idx]
-            x = self.maze_x + c.c * self.cell_size
-            y = self.maze_y + c.r * self.cell_size
+            c, r = self.maze.coords(idx)
+            x = self.maze_x + c * self.cell_size
+            y = self.maze_y + r * self.cell_size
             size = max(self.cell_size - 4, 2)
             offset = (self.cell_size - size) // 2
             pygame.draw.rect(self.screen, color, 
@@ -485,12 +764,10 @@ class Visualizer:
         px = self.panel_x + 15
         
         # Title
-        title = self.font_title.render("Auto Maze", True, TEXT)
-        self.screen.blit(title, (px, py))
+        self.screen.blit(self.title_surf, (px, py))
         py += 35
         
-        subtitle = self.font.render("Solver", True, TEXT_LIGHT)
-        self.screen.blit(subtitle, (px, py))
+        self.screen.blit(self.subtitle_surf, (px, py))
         py += 35
         
         # Divider
@@ -499,11 +776,10 @@ class Visualizer:
         py += 18
         
         # Algorithm section
-        label = self.font_label.render("ALGORITHM", True, TEXT_LIGHT)
-        self.screen.blit(label, (px, py))
+        self.screen.blit(self.algorithm_label_surf, (px, py))
         
         # Update button states
-        for btn in self.buttons[:4]:
+        for btn in self.buttons[:len(ALGORITHM_MAP)]:
             btn.active = (btn.text == self.algorithm_name)
         
         # Difficulty states
@@ -511,31 +787,36 @@ class Visualizer:
             btn.active = (btn.text == self.diff_name)
         
         # Stats box at bottom
-        stats_y = self.panel_y + self.panel_h - 180
+        stats_y = self.stats_rect.y
         stats_box = pygame.Rect(px, stats_y, self.panel_w - 30, 110)
         pygame.draw.rect(self.screen, BG, stats_box, border_radius=8)
         
         stats_y += 12
         
         # Stats
-        label = self.font_label.render("STATISTICS", True, TEXT_LIGHT)
-        self.screen.blit(label, (px + 10, stats_y))
+        self.screen.blit(self.stats_label_surf, (px + 10, stats_y))
         stats_y += 22
         
-        stats = [
-            f"Grid: {self.cols} × {self.rows}",
-            f"Explored: {len(self.search_visited)}",
-            f"Path: {len(self.search_path)}"
-        ]
-        
-        for stat in stats:
-            text = self.font.render(stat, True, TEXT)
+        explored = np.count_nonzero(self.search_visited)
+        stats_key = (self.cols, self.rows, explored, len(self.search_path))
+        if stats_key != self.stats_key:
+            self.stats_key = stats_key
+            stats = [
+                f"Grid: {self.cols} × {self.rows}",
+                f"Explored: {explored}",
+                f"Path: {len(self.search_path)}"
+            ]
+            self.stats_surfs = [self.font.render(stat, True, TEXT) for stat in stats]
+        
+        for text in self.stats_surfs:
             self.screen.blit(text, (px + 10, stats_y))
             stats_y += 22
         
         # Status
         stats_y += 15
-        if self.generating:
+        if self.compiling:
+            status, color = "⚙ Compiling solvers...", TEXT_LIGHT
+        elif self.generating:
             status, color = "⚙ Generating...", TEXT_LIGHT
         elif self.running_search:
             status, color = "🔍 Searching...", BTN_ACTIVE
@@ -544,14 +825,19 @@ class Visualizer:
         else:
             status, color = "● Ready", TEXT
         
-        text = self.font.render(status, True, color)
+        text = self.status_surfs.get(status)
+        if text is None:
+            text = self.status_surfs[status] = self.font.render(status, True, color)
         text_rect = text.get_rect(centerx=self.panel_x + self.panel_w // 2, y=stats_y)
         self.screen.blit(text, text_rect)
         
         # Draw buttons
         mouse_pos = pygame.mouse.get_pos()
         for btn in self.buttons:
-            btn.hovered = btn.rect.collidepoint(mouse_pos)
+            hovered = btn.rect.collidepoint(mouse_pos)
+            if hovered != btn.hovered:
+                btn.hovered = hovered
+                self.dirty.append(btn.rect)
             btn.draw(self.screen)
 
     def step_search(self):
@@ -567,13 +853,14 @@ class Visualizer:
             return
         
         code = msg[0]
+        self.dirty.append(self.stats_rect)
         if code == "visit":
-            self.search_visited = set(msg[2]) if len(msg) > 2 else set()
-            self.search_came_from = dict(msg[3]) if len(msg) > 3 else {}
+            self.paint_visited()
         elif code == "found":
             self.search_path = msg[1]
             self.running_search = False
             self.search_complete = True
+            self.dirty.append(self.maze_rect)
         elif code == "notfound":
             self.running_search = False
 
@@ -583,15 +870,22 @@ class Visualizer:
         
         while running:
             self.clock.tick(FPS)
+            # Read the cursor after event.get() has pumped the queue, so hover
+            # is judged against this frame's position rather than the last one
+            events = pygame.event.get()
             mouse_pos = pygame.mouse.get_pos()
             
-            for event in pygame.event.get():
+            for event in events:
                 if event.type == pygame.QUIT:
                     running = False
+                elif event.type == pygame.VIDEOEXPOSE:
+                    self.mark_all_dirty()
                 elif event.type == pygame.VIDEORESIZE:
                     self.width, self.height = event.w, event.h
                     self.screen = pygame.display.set_mode((self.width, self.height), pygame.RESIZABLE)
-                    self.set_difficulty(self.diff_name)  # Recalculate layout
+                    # Layout only; the maze and any running search are kept
+                    self._recompute_layout()
+                    self.mark_all_dirty()
                 elif event.type == pygame.KEYDOWN:
                     if event.key == pygame.K_ESCAPE:
                         running = False
@@ -610,6 +904,8 @@ class Visualizer:
                         self.select_algorithm("Dijkstra")
                     elif event.key == pygame.K_4:
                         self.select_algorithm("A*")
+                    elif event.key == pygame.K_5:
+                        self.select_algorithm("BFS-Bi")
                     elif event.key == pygame.K_e:
                         self.set_difficulty("Easy")
                     elif event.key == pygame.K_m:
@@ -617,16 +913,36 @@ class Visualizer:
                     elif event.key == pygame.K_h:
                         self.set_difficulty("Hard")
                 
+                if event.type in (pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN):
+                    self.mark_all_dirty()
+                
                 for btn in self.buttons:
+                    was_hovered = btn.hovered
                     btn.handle_event(event, mouse_pos)
+                    if btn.hovered != was_hovered:
+                        self.dirty.append(btn.rect)
             
+            # Run every step that fell due since the last frame, so a step delay
+            # shorter than a frame is not capped at one step per frame
+            now = pygame.time.get_ticks()
             if self.running_search:
-                if pygame.time.get_ticks() - last_step >= max(1, int(self.step_delay)):
+                delay = max(1, int(self.step_delay))
+                steps = 0
+                while self.running_search and now - last_step >= delay:
                     self.step_search()
-                    last_step = pygame.time.get_ticks()
+                    last_step += delay
+                    steps += 1
+                    if steps >= MAX_STEPS_PER_FRAME:
+                        last_step = now
+                        break
+            else:
+                last_step = now
             
-            self.draw()
-            pygame.display.flip()
+            # Nothing changed since the last frame: skip drawing entirely
+            if self.dirty:
+                self.draw()
+                pygame.display.update(self.dirty)
+                self.dirty.clear()
         
         pygame.quit()
 
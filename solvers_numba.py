@@ -0,0 +1,360 @@
+"""
+Compiled pathfinding kernels over the flat maze adjacency array
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+# Every kernel takes adj[i, d] (neighbour through side d, or -1) and returns
+#   expanded     - node handed to the visualizer at each step
+#   marked       - nodes in the order they joined the visited set
+#   mark_counts  - len(visited) right after each step, for slicing `marked`
+#   parent       - came_from as an int32 array, -1 where unset
+#   path         - start-exclusive path to end, empty if not found
+
+
+@njit(cache=True)
+def _path(parent, end):
+    length = 0
+    cur = end
+    while parent[cur] >= 0:
+        length += 1
+        cur = parent[cur]
+    path = np.empty(length, dtype=np.int32)
+    cur = end
+    for i in range(length - 1, -1, -1):
+        path[i] = cur
+        cur = parent[cur]
+    return path
+
+
+# Indexed binary heap: slot i holds node heap[i] with key keys[i], and
+# pos[node] is that node's slot or -1 when it is not queued. Each node is
+# queued at most once, so the arrays never need more than n slots.
+
+@njit(cache=True)
+def _heap_push_or_decrease(heap, keys, pos, size, node, key):
+    i = pos[node]
+    if i < 0:
+        i = size
+        size += 1
+    # Sift up; a decrease-key only ever moves the node towards the root
+    while i > 0:
+        p = (i - 1) >> 1
+        if keys[p] <= key:
+            break
+        heap[i] = heap[p]
+        keys[i] = keys[p]
+        pos[heap[i]] = i
+        i = p
+    heap[i] = node
+    keys[i] = key
+    pos[node] = i
+    return size
+
+
+@njit(cache=True)
+def _heap_pop(heap, keys, pos, size):
+    node = heap[0]
+    pos[node] = -1
+    size -= 1
+    if size == 0:
+        return node, size
+    last = heap[size]
+    key = keys[size]
+    i = 0
+    while True:
+        child = 2 * i + 1
+        if child >= size:
+            break
+        if child + 1 < size and keys[child + 1] < keys[child]:
+            child += 1
+        if key <= keys[child]:
+            break
+        heap[i] = heap[child]
+        keys[i] = keys[child]
+        pos[heap[i]] = i
+        i = child
+    heap[i] = last
+    keys[i] = key
+    pos[last] = i
+    return node, size
+
+
+@njit(cache=True)
+def dfs(adj, start, end):
+    n = adj.shape[0]
+    visited = np.zeros(n, dtype=np.bool_)
+    parent = np.full(n, -1, dtype=np.int32)
+    expanded = np.empty(n, dtype=np.int32)
+    marked = np.empty(n, dtype=np.int32)
+    mark_counts = np.empty(n, dtype=np.int32)
+    # Each expansion pushes at most 4 entries
+    stack_node = np.empty(4 * n + 1, dtype=np.int32)
+    stack_parent = np.empty(4 * n + 1, dtype=np.int32)
+    stack_node[0] = start
+    stack_parent[0] = -1
+    top = 1
+    steps = 0
+    n_marked = 0
+    found = False
+    while top > 0:
+        top -= 1
+        node = stack_node[top]
+        if visited[node]:
+            continue
+        visited[node] = True
+        if stack_parent[top] >= 0:
+            parent[node] = stack_parent[top]
+        marked[n_marked] = node
+        n_marked += 1
+        expanded[steps] = node
+        mark_counts[steps] = n_marked
+        steps += 1
+        if node == end:
+            found = True
+            break
+        order = np.random.permutation(4)
+        for k in range(4):
+            nb = adj[node, order[k]]
+            if nb >= 0 and not visited[nb]:
+                stack_node[top] = nb
+                stack_parent[top] = node
+                top += 1
+    path = _path(parent, end) if found else np.empty(0, dtype=np.int32)
+    return expanded[:steps], marked[:n_marked], mark_counts[:steps], parent, path
+
+
+@njit(cache=True)
+def bfs(adj, start, end):
+    n = adj.shape[0]
+    visited = np.zeros(n, dtype=np.bool_)
+    parent = np.full(n, -1, dtype=np.int32)
+    expanded = np.empty(n, dtype=np.int32)
+    marked = np.empty(n, dtype=np.int32)
+    mark_counts = np.empty(n, dtype=np.int32)
+    # Every node is enqueued at most once, so the queue never wraps
+    queue = np.empty(n, dtype=np.int32)
+    queue[0] = start
+    head = 0
+    tail = 1
+    visited[start] = True
+    marked[0] = start
+    n_marked = 1
+    steps = 0
+    found = False
+    while head < tail:
+        node = queue[head]
+        head += 1
+        expanded[steps] = node
+        mark_counts[steps] = n_marked
+        steps += 1
+        if node == end:
+            found = True
+            break
+        for k in range(4):
+            nb = adj[node, k]
+            if nb >= 0 and not visited[nb]:
+                visited[nb] = True
+                parent[nb] = node
+                marked[n_marked] = nb
+                n_marked += 1
+                queue[tail] = nb
+                tail += 1
+    path = _path(parent, end) if found else np.empty(0, dtype=np.int32)
+    return expanded[:steps], marked[:n_marked], mark_counts[:steps], parent, path
+
+
+@njit(cache=True)
+def dijkstra(adj, start, end):
+    n = adj.shape[0]
+    visited = np.zeros(n, dtype=np.bool_)
+    parent = np.full(n, -1, dtype=np.int32)
+    dist = np.full(n, np.iinfo(np.int32).max, dtype=np.int32)
+    expanded = np.empty(n, dtype=np.int32)
+    marked = np.empty(n, dtype=np.int32)
+    mark_counts = np.empty(n, dtype=np.int32)
+    # Key d * n + node orders nodes like the (d, node, parent) heapq tuples
+    heap = np.empty(n, dtype=np.int32)
+    pos = np.full(n, -1, dtype=np.int32)
+    keys = np.empty(n, dtype=np.int64)
+    dist[start] = 0
+    size = _heap_push_or_decrease(heap, keys, pos, 0, start, np.int64(start))
+    steps = 0
+    found = False
+    while size > 0:
+        node, size = _heap_pop(heap, keys, pos, size)
+        visited[node] = True
+        marked[steps] = node
+        expanded[steps] = node
+        mark_counts[steps] = steps + 1
+        steps += 1
+        if node == end:
+            found = True
+            break
+        nd = dist[node] + 1
+        for k in range(4):
+            nb = adj[node, k]
+            if nb >= 0 and nd < dist[nb]:
+                dist[nb] = nd
+                parent[nb] = node
+                size = _heap_push_or_decrease(heap, keys, pos, size, nb, np.int64(nd) * n + nb)
+    path = _path(parent, end) if found else np.empty(0, dtype=np.int32)
+    return expanded[:steps], marked[:steps], mark_counts[:steps], parent, path
+
+
+@njit(cache=True)
+def astar(adj, start, end, cols):
+    n = adj.shape[0]
+    er, ec = end // cols, end % cols
+    closed = np.zeros(n, dtype=np.bool_)
+    parent = np.full(n, -1, dtype=np.int32)
+    g = np.full(n, np.iinfo(np.int32).max, dtype=np.int32)
+    expanded = np.empty(n, dtype=np.int32)
+    marked = np.empty(n, dtype=np.int32)
+    mark_counts = np.empty(n, dtype=np.int32)
+    heap = np.empty(n, dtype=np.int32)
+    pos = np.full(n, -1, dtype=np.int32)
+    keys = np.empty(n, dtype=np.int64)
+    g[start] = 0
+    h = abs(start % cols - ec) + abs(start // cols - er)
+    size = _heap_push_or_decrease(heap, keys, pos, 0, start, np.int64(h) * n + start)
+    steps = 0
+    found = False
+    while size > 0:
+        node, size = _heap_pop(heap, keys, pos, size)
+        closed[node] = True
+        marked[steps] = node
+        expanded[steps] = node
+        mark_counts[steps] = steps + 1
+        steps += 1
+        if node == end:
+            found = True
+            break
+        tentative_g = g[node] + 1
+        for k in range(4):
+            nb = adj[node, k]
+            if nb < 0:
+                continue
+            if closed[nb] and tentative_g >= g[nb]:
+                continue
+            if tentative_g < g[nb]:
+                parent[nb] = node
+                g[nb] = tentative_g
+                if closed[nb]:
+                    continue
+                h = abs(nb % cols - ec) + abs(nb // cols - er)
+                size = _heap_push_or_decrease(heap, keys, pos, size, nb,
+                                              np.int64(tentative_g + h) * n + nb)
+    path = _path(parent, end) if found else np.empty(0, dtype=np.int32)
+    return expanded[:steps], marked[:steps], mark_counts[:steps], parent, path
+
+
+@njit(cache=True)
+def bibfs(adj, start, end):
+    n = adj.shape[0]
+    # side[i] is 1 if reached from the start, 2 if reached from the end
+    side = np.zeros(n, dtype=np.int8)
+    parent_fwd = np.full(n, -1, dtype=np.int32)
+    parent_bwd = np.full(n, -1, dtype=np.int32)
+    expanded = np.empty(n, dtype=np.int32)
+    marked = np.empty(n, dtype=np.int32)
+    mark_counts = np.empty(n, dtype=np.int32)
+    # One queue per side; each node is enqueued at most once overall
+    queue = np.empty((2, n), dtype=np.int32)
+    head = np.zeros(2, dtype=np.int64)
+    tail = np.ones(2, dtype=np.int64)
+    queue[0, 0] = start
+    queue[1, 0] = end
+    side[start] = 1
+    side[end] = 2
+    marked[0] = start
+    n_marked = 1
+    if end != start:
+        marked[1] = end
+        n_marked = 2
+    steps = 0
+    if start == end:
+        expanded[0] = start
+        mark_counts[0] = n_marked
+        return expanded[:1], marked[:n_marked], mark_counts[:1], parent_fwd, np.empty(0, dtype=np.int32)
+    fwd = -1
+    bwd = -1
+    turn = 0
+    while fwd < 0 and head[0] < tail[0] and head[1] < tail[1]:
+        # Expand one whole level of the current side, then swap sides
+        level_end = tail[turn]
+        while fwd < 0 and head[turn] < level_end:
+            node = queue[turn, head[turn]]
+            head[turn] += 1
+            expanded[steps] = node
+            mark_counts[steps] = n_marked
+            steps += 1
+            for k in range(4):
+                nb = adj[node, k]
+                if nb < 0:
+                    continue
+                if side[nb] == 0:
+                    side[nb] = turn + 1
+                    if turn == 0:
+                        parent_fwd[nb] = node
+                    else:
+                        parent_bwd[nb] = node
+                    marked[n_marked] = nb
+                    n_marked += 1
+                    queue[turn, tail[turn]] = nb
+                    tail[turn] += 1
+                elif side[nb] != turn + 1:
+                    if turn == 0:
+                        fwd, bwd = node, nb
+                    else:
+                        fwd, bwd = nb, node
+                    break
+        turn = 1 - turn
+    # Single parent array for the visualizer: each node belongs to one side
+    parent = np.where(side == 2, parent_bwd, parent_fwd)
+    if fwd < 0:
+        return expanded[:steps], marked[:n_marked], mark_counts[:steps], parent, np.empty(0, dtype=np.int32)
+    front = _path(parent_fwd, fwd)
+    length = 0
+    cur = bwd
+    while cur != end:
+        length += 1
+        cur = parent_bwd[cur]
+    path = np.empty(len(front) + length + 1, dtype=np.int32)
+    path[:len(front)] = front
+    cur = bwd
+    for i in range(len(front), len(front) + length):
+        path[i] = cur
+        cur = parent_bwd[cur]
+    path[len(path) - 1] = end
+    return expanded[:steps], marked[:n_marked], mark_counts[:steps], parent, path
+
+
+def warm_up(callback=None):
+    # Compile every kernel on a two-cell maze so the first real search does
+    # not stall; `callback` runs between kernels to keep the UI responsive
+    if not NUMBA_AVAILABLE:
+        return
+    adj = np.array([[-1, 1, -1, -1], [-1, -1, -1, 0]], dtype=np.int32)
+    kernels = (
+        lambda: dfs(adj, 0, 1),
+        lambda: bfs(adj, 0, 1),
+        lambda: dijkstra(adj, 0, 1),
+        lambda: astar(adj, 0, 1, 2),
+        lambda: bibfs(adj, 0, 1),
+    )
+    for kernel in kernels:
+        kernel()
+        if callback:
+            callback()